@@ -1,9 +1,12 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
-from sqlalchemy import text
-from db.session import db_session
-from datetime import datetime, timedelta, date
+import plotly.graph_objects as go
+import connectorx as cx
+from numba import njit
+from db.db_utils import DatabaseUtils
+from datetime import datetime, timedelta, date, time
 import calendar
 import os
 from dotenv import load_dotenv
@@ -70,141 +73,230 @@ st.markdown(
 # --- DATA FETCHING ---
 @st.cache_data(ttl=3600)
 def get_route_data(start_date_obj, end_date_obj):
-    query = text(TECH_TIMELINE_QUERY)
     start_str = start_date_obj.strftime("%Y-%m-%d")
     end_str = end_date_obj.strftime("%Y-%m-%d")
 
-    with next(db_session()) as session:
-        result = session.execute(query, {"start_date": start_str, "end_date": end_str})
-        return pd.DataFrame(result.all(), columns=result.keys())
+    # connectorx reads straight into Arrow's columnar layout - no Python list
+    # of Row tuples and no per-cell dtype inference. It has no bind-parameter
+    # support, so the two app-generated date literals are inlined.
+    query = TECH_TIMELINE_QUERY.replace(":start_date", f"'{start_str}'").replace(
+        ":end_date", f"'{end_str}'"
+    )
+    table = cx.read_sql(DatabaseUtils.get_connectorx_uri(), query, return_type="arrow")
+    # Plain to_pandas() keeps numpy-backed datetime64[ns] columns, which the
+    # int64-nanosecond stats math relies on.
+    df = table.to_pandas()
+
+    # Coerce coordinates once here, behind the cache, instead of reparsing
+    # strings on every rerun. Becomes a no-op if the deployed query is
+    # updated to CAST(Latitude/Longitude AS FLOAT).
+    for col in ("Latitude", "Longitude"):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col])
+    return df
 
 
 # --- PROCESSING LOGIC ---
+# Columns the aggregation actually reads; everything else (lat/lon,
+# ServiceCode, ...) only matters to the map and raw-data sections
+_STATS_COLS = [
+    "LeadTechnician",
+    "StartedTravel",
+    "ArrivalTimeReal",
+    "DepartureTimeReal",
+    "SessionID",
+    "CompanyName",
+]
+
+
+@njit(cache=True)
+def _accum_group_stats(
+    group_id,
+    start_ns,
+    end_ns,
+    task_code,
+    day_start_ns,
+    day_end_ns,
+    out_idle,
+    out_travel,
+    out_service,
+):
+    """Single compiled pass over intervals sorted by (group, start).
+
+    Clips each interval to its day window, accumulates idle gaps against the
+    running max end per group, and splits covered time by task_code
+    (0=Travel, 1=Service). Unclipped trailing time up to the day end is idle.
+    """
+    prev_group = -1
+    current = 0
+    prev_day_end = 0
+    for i in range(group_id.shape[0]):
+        g = group_id[i]
+        if g != prev_group:
+            if prev_group >= 0 and current < prev_day_end:
+                out_idle[prev_group] += prev_day_end - current
+            current = day_start_ns[i]
+            prev_group = g
+        prev_day_end = day_end_ns[i]
+
+        ts = max(start_ns[i], day_start_ns[i])
+        te = min(end_ns[i], day_end_ns[i])
+        if ts < te:
+            if ts > current:
+                out_idle[g] += ts - current
+            if task_code[i] == 0:
+                out_travel[g] += te - ts
+            else:
+                out_service[g] += te - ts
+            if te > current:
+                current = te
+    if prev_group >= 0 and current < prev_day_end:
+        out_idle[prev_group] += prev_day_end - current
+
+
 def calculate_efficiency_stats(
     df, target_date, day_start_calc, day_end_calc, total_work_mins_per_day
 ):
     if df.empty:
-        return pd.DataFrame(), 0, 0, 0, 0
+        return pd.DataFrame(), 0, 0, 0, pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
-    rows = []
     # Note: For monthly stats we don't need a vis window, but we reuse the clipping logic
 
-    # Group by Technician and Date to handle multiple days in month
-    # First, flatten the data for easy interval processing
-    for _, row in df.iterrows():
-        tech = row["LeadTechnician"] if row["LeadTechnician"] else "Unknown"
-
-        def add_interval(start, end, task, session_id):
-            if not start or not end or start >= end:
-                return
-            rows.append(
-                {
-                    "Technician": tech,
-                    "Start": start,
-                    "End": end,
-                    "Task": task,
-                    "Date": start.date(),
-                }
-            )
-
-        add_interval(
-            row["StartedTravel"], row["ArrivalTimeReal"], "Travel", row["SessionID"]
-        )
-        add_interval(
-            row["ArrivalTimeReal"],
-            row["DepartureTimeReal"],
-            "Service",
-            row["SessionID"],
-        )
-        # Store company info for classification
-        rows[-1]["CompanyName"] = row["CompanyName"]
+    # Flatten each source row into Travel/Service intervals using column slices
+    # instead of iterrows() - all construction stays in vectorized pandas ops
+    base_cols = ["LeadTechnician", "SessionID", "CompanyName"]
+    travel = df[base_cols + ["StartedTravel", "ArrivalTimeReal"]].rename(
+        columns={"StartedTravel": "Start", "ArrivalTimeReal": "End"}
+    )
+    travel["Task"] = "Travel"
+    service = df[base_cols + ["ArrivalTimeReal", "DepartureTimeReal"]].rename(
+        columns={"ArrivalTimeReal": "Start", "DepartureTimeReal": "End"}
+    )
+    service["Task"] = "Service"
 
-    plot_df = pd.DataFrame(rows)
+    plot_df = pd.concat([travel, service], ignore_index=True)
+    valid = (
+        plot_df["Start"].notna()
+        & plot_df["End"].notna()
+        & (plot_df["Start"] < plot_df["End"])
+    )
+    plot_df = plot_df[valid].copy()
     if plot_df.empty:
-        return pd.DataFrame(), 0, 0, 0, 0
+        return pd.DataFrame(), 0, 0, 0, pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+    plot_df["Technician"] = plot_df["LeadTechnician"].mask(
+        plot_df["LeadTechnician"].isna() | plot_df["LeadTechnician"].eq(""), "Unknown"
+    ).astype("category")  # small int codes instead of per-row string hashing
+    plot_df["Date"] = plot_df["Start"].dt.date
+    plot_df = plot_df.drop(columns=["LeadTechnician"])
 
     # --- FILTER MINIMAL DATA (< 5 mins total active time per technician per day) ---
-    plot_df["Duration_Min"] = (
-        plot_df["End"] - plot_df["Start"]
-    ).dt.total_seconds() / 60
-    tech_daily_active = (
-        plot_df.groupby(["Technician", "Date"])["Duration_Min"].sum().reset_index()
+    # Durations stay int64 nanoseconds end to end; seconds only appear at the
+    # final reporting step
+    plot_df["Duration_Ns"] = plot_df["End"].to_numpy().view("i8") - plot_df[
+        "Start"
+    ].to_numpy().view("i8")
+    tech_daily_active = plot_df.groupby(
+        ["Technician", "Date"], sort=False, observed=True
+    )["Duration_Ns"].sum()
+    valid_keys = tech_daily_active.index[tech_daily_active >= 5 * 60 * 1_000_000_000]
+
+    # Keep only valid days/technicians via an index membership test instead
+    # of a hash-join merge that allocates a whole new frame
+    row_keys = pd.MultiIndex.from_arrays([plot_df["Technician"], plot_df["Date"]])
+    plot_df = plot_df[row_keys.isin(valid_keys)]
+
+    # --- METRICS ---
+    # Clip every interval to its date's work window and accumulate idle /
+    # travel / service per (Technician, Date) with column ops on int64
+    # nanosecond timestamps - no Python-level iteration over rows or groups.
+    group_keys = ["Technician", "Date"]
+
+    day_start_off = pd.Timedelta(
+        hours=day_start_calc.hour,
+        minutes=day_start_calc.minute,
+        seconds=day_start_calc.second,
+    ).value
+    day_end_off = pd.Timedelta(
+        hours=day_end_calc.hour,
+        minutes=day_end_calc.minute,
+        seconds=day_end_calc.second,
+    ).value
+
+    ordered = plot_df.sort_values(group_keys + ["Start"])
+    first_of_group = ~ordered.duplicated(subset=group_keys)
+    group_id = (first_of_group.cumsum() - 1).to_numpy(dtype=np.int64)
+    all_groups = pd.MultiIndex.from_frame(ordered.loc[first_of_group, group_keys])
+    n_groups = len(all_groups)
+
+    # Convert each unique date to its epoch-ns midnight once and broadcast,
+    # rather than parsing the per-row Python date objects individually
+    unique_dates = ordered["Date"].unique()
+    date_ns_map = pd.Series(
+        pd.to_datetime(unique_dates).astype("int64"), index=unique_dates
+    )
+    date_ns = ordered["Date"].map(date_ns_map).to_numpy()
+
+    idle_ns = np.zeros(n_groups, dtype=np.int64)
+    travel_ns = np.zeros(n_groups, dtype=np.int64)
+    service_ns = np.zeros(n_groups, dtype=np.int64)
+    _accum_group_stats(
+        group_id,
+        ordered["Start"].astype("int64").to_numpy(),
+        ordered["End"].astype("int64").to_numpy(),
+        (ordered["Task"].to_numpy() == "Service").astype(np.uint8),
+        date_ns + day_start_off,
+        date_ns + day_end_off,
+        idle_ns,
+        travel_ns,
+        service_ns,
     )
-    valid_threshold = tech_daily_active[tech_daily_active["Duration_Min"] >= 5]
 
-    # Merge back to keep only valid days/technicians
-    plot_df = plot_df.merge(
-        valid_threshold[["Technician", "Date"]], on=["Technician", "Date"]
+    stats = pd.DataFrame(
+        {
+            "Idle Secs": idle_ns / 1e9,
+            "Travel Secs": travel_ns / 1e9,
+            "Service Secs": service_ns / 1e9,
+        },
+        index=all_groups,
+    )
+
+    # Classification: Mobile (>1 unique CompanyName) vs Stationary (1)
+    unique_companies = (
+        plot_df.dropna(subset=["CompanyName"])
+        .groupby(group_keys, sort=False, observed=True)["CompanyName"]
+        .nunique()
+        .reindex(all_groups, fill_value=0)
+    )
+    stats["Type"] = np.where(unique_companies > 1, "Mobile", "Stationary")
+
+    day_stats = stats.reset_index()
+    agg_stats, idle_pct, travel_pct, service_pct, type_summary = summarize_stats(
+        day_stats, total_work_mins_per_day
+    )
+
+    return (
+        agg_stats,
+        idle_pct,
+        travel_pct,
+        service_pct,
+        plot_df,
+        type_summary,
+        day_stats,
     )
 
-    # --- METRICS ---
-    global_idle_secs = 0
-    global_travel_secs = 0
-    global_service_secs = 0
-    total_tech_days = 0
-
-    stats_data = []
-
-    # Iterate by Technician and Date
-    grouped = plot_df.groupby(["Technician", "Date"])
-    for (tech, task_date), tech_tasks in grouped:
-        tech_tasks = tech_tasks.sort_values("Start")
-
-        # Adjust calculation window for THIS specific date
-        d_start_c = datetime.combine(task_date, day_start_calc.time())
-        d_end_c = datetime.combine(task_date, day_end_calc.time())
-
-        tech_idle_secs = 0
-        tech_travel_secs = 0
-        tech_service_secs = 0
-        current_time = d_start_c
-
-        for _, task in tech_tasks.iterrows():
-            t_start_c = max(task["Start"], d_start_c)
-            t_end_c = min(task["End"], d_end_c)
-
-            if t_start_c < t_end_c:
-                if t_start_c > current_time:
-                    tech_idle_secs += (t_start_c - current_time).total_seconds()
-
-                duration = (t_end_c - t_start_c).total_seconds()
-                if task["Task"] == "Travel":
-                    tech_travel_secs += duration
-                else:
-                    tech_service_secs += duration
-
-                current_time = max(current_time, t_end_c)
-
-        if current_time < d_end_c:
-            tech_idle_secs += (d_end_c - current_time).total_seconds()
-
-        global_idle_secs += tech_idle_secs
-        global_travel_secs += tech_travel_secs
-        global_service_secs += tech_service_secs
-        total_tech_days += 1
-
-        # Classification: Mobile (>1 unique CompanyName) vs Stationary (1)
-        unique_companies = tech_tasks.dropna(subset=["CompanyName"])[
-            "CompanyName"
-        ].nunique()
-        tech_type = "Mobile" if unique_companies > 1 else "Stationary"
-
-        stats_data.append(
-            {
-                "Technician": tech,
-                "Date": task_date,
-                "Type": tech_type,
-                "Idle Secs": tech_idle_secs,
-                "Travel Secs": tech_travel_secs,
-                "Service Secs": tech_service_secs,
-            }
-        )
 
+def summarize_stats(day_stats, total_work_mins_per_day):
+    """Roll per-(Technician, Date) idle/travel/service records up to
+    technician totals, global percentages and the tech-type summary.
+
+    day_stats carries one record per technician-day, so it can be the full
+    month or any slice of it (e.g. a single Focus Date)."""
     # Aggregate by Technician
-    df_temp = pd.DataFrame(stats_data)
-    if not df_temp.empty:
+    if not day_stats.empty:
+        # sort stays on: agg_stats row order is what the UI lists
         agg_stats = (
-            df_temp.groupby("Technician")
+            day_stats.groupby("Technician", observed=True)
             .agg(
                 {
                     "Idle Secs": "sum",
@@ -223,12 +315,12 @@ def calculate_efficiency_stats(
     agg_stats["Travel Mins"] = (agg_stats["Travel Secs"] / 60).astype(int)
 
     # Total work mins for the period for EACH technician is: (number of days worked) * 540
+    # One record per technician-day, so the group sizes are the days worked
     tech_days_worked = (
-        plot_df[["Technician", "Date"]]
-        .drop_duplicates()
-        .groupby("Technician")
+        day_stats.groupby("Technician", sort=False, observed=True)
         .size()
-        .reset_index(name="Days")
+        .rename("Days")
+        .reset_index()
     )
     agg_stats = agg_stats.merge(tech_days_worked, on="Technician")
     agg_stats["Total Work Mins"] = agg_stats["Days"] * total_work_mins_per_day
@@ -248,23 +340,27 @@ def calculate_efficiency_stats(
         1,
     )
 
-    total_possible_secs = total_tech_days * total_work_mins_per_day * 60
+    total_possible_secs = len(day_stats) * total_work_mins_per_day * 60
 
     global_stats = {
-        "idle_pct": round((global_idle_secs / total_possible_secs) * 100, 1)
+        "idle_pct": round((day_stats["Idle Secs"].sum() / total_possible_secs) * 100, 1)
         if total_possible_secs > 0
         else 0,
-        "travel_pct": round((global_travel_secs / total_possible_secs) * 100, 1)
+        "travel_pct": round(
+            (day_stats["Travel Secs"].sum() / total_possible_secs) * 100, 1
+        )
         if total_possible_secs > 0
         else 0,
-        "service_pct": round((global_service_secs / total_possible_secs) * 100, 1)
+        "service_pct": round(
+            (day_stats["Service Secs"].sum() / total_possible_secs) * 100, 1
+        )
         if total_possible_secs > 0
         else 0,
     }
 
     # Tech Type Summary
     type_summary = (
-        agg_stats.groupby("Type")
+        agg_stats.groupby("Type", observed=True)
         .agg(
             {
                 "Technician": "count",
@@ -288,11 +384,26 @@ def calculate_efficiency_stats(
         global_stats["idle_pct"],
         global_stats["travel_pct"],
         global_stats["service_pct"],
-        plot_df,
         type_summary,
     )
 
 
+@st.cache_data(ttl=3600)
+def get_efficiency_stats(
+    start_date_obj, end_date_obj, day_start_h, day_end_h, total_work_mins_per_day
+):
+    """Cached aggregation for a date window, keyed on hashable primitives so
+    reruns with an unchanged window skip both the query and the number
+    crunching."""
+    df = get_route_data(start_date_obj, end_date_obj)
+    if not df.empty:
+        df = df[_STATS_COLS]
+    # Bare time-of-day objects are all the clipping math needs
+    return calculate_efficiency_stats(
+        df, start_date_obj, time(day_start_h), time(day_end_h), total_work_mins_per_day
+    )
+
+
 # --- APP UI ---
 st.markdown(f'<h1 class="title-text">{APP_TITLE}</h1>', unsafe_allow_html=True)
 
@@ -306,8 +417,8 @@ with st.sidebar:
     )
 
 # Constants
-DAY_START_CALC = datetime.combine(date.today(), datetime.min.time()).replace(hour=8)
-DAY_END_CALC = datetime.combine(date.today(), datetime.min.time()).replace(hour=17)
+DAY_START_HOUR = 8
+DAY_END_HOUR = 17
 TOTAL_WORK_MINS_PER_DAY = 540
 
 try:
@@ -321,14 +432,20 @@ try:
         month_df = get_route_data(m_start, m_end)
 
     if not month_df.empty:
-        agg_month, g_idle_m, g_travel_m, g_service_m, _, month_type_summary = (
-            calculate_efficiency_stats(
-                month_df,
-                selected_date,
-                DAY_START_CALC,
-                DAY_END_CALC,
-                TOTAL_WORK_MINS_PER_DAY,
-            )
+        (
+            agg_month,
+            g_idle_m,
+            g_travel_m,
+            g_service_m,
+            month_plot_df,
+            month_type_summary,
+            month_day_stats,
+        ) = get_efficiency_stats(
+            m_start,
+            m_end,
+            DAY_START_HOUR,
+            DAY_END_HOUR,
+            TOTAL_WORK_MINS_PER_DAY,
         )
 
         st.markdown(f"### Performance Summary - {selected_date.strftime('%B %Y')}")
@@ -396,20 +513,23 @@ try:
     d_start = selected_date
     d_end = selected_date + timedelta(days=1)
 
-    daily_df = get_route_data(d_start, d_end)
+    # The day is a strict subset of the month already in memory - mask it
+    # instead of paying a second DB round-trip
+    daily_df = month_df[
+        (month_df["StartedTravel"] >= pd.Timestamp(d_start))
+        & (month_df["StartedTravel"] < pd.Timestamp(d_end))
+    ]
 
     if daily_df.empty:
         st.warning(f"No daily data for {selected_date.strftime('%Y-%m-%d')}")
     else:
-        # Preprocessing for Daily
-        agg_day, g_idle_d, g_travel_d, g_service_d, plot_df, day_type_summary = (
-            calculate_efficiency_stats(
-                daily_df,
-                selected_date,
-                DAY_START_CALC,
-                DAY_END_CALC,
-                TOTAL_WORK_MINS_PER_DAY,
-            )
+        # Preprocessing for Daily: the monthly pass already produced one
+        # record per technician-day and the flattened intervals, so slice the
+        # Focus Date out instead of re-running the aggregation
+        day_stats = month_day_stats[month_day_stats["Date"] == selected_date]
+        plot_df = month_plot_df[month_plot_df["Date"] == selected_date]
+        agg_day, g_idle_d, g_travel_d, g_service_d, day_type_summary = (
+            summarize_stats(day_stats, TOTAL_WORK_MINS_PER_DAY)
         )
 
         st.markdown(f"### Daily Summary - {selected_date.strftime('%Y-%m-%d')}")
@@ -457,8 +577,26 @@ try:
 
         with col_main:
             if not plot_df.empty:
+                # Merge runs of back-to-back same-task intervals so Plotly
+                # draws one bar per run instead of one per raw row
+                timeline_df = plot_df.sort_values(["Technician", "Start"])
+                new_block = (
+                    timeline_df["Technician"].ne(timeline_df["Technician"].shift())
+                    | timeline_df["Task"].ne(timeline_df["Task"].shift())
+                    | timeline_df["Start"].ne(timeline_df["End"].shift())
+                )
+                timeline_df = (
+                    timeline_df.assign(Block=new_block.cumsum())
+                    .groupby(
+                        ["Technician", "Block", "Task"],
+                        as_index=False,
+                        observed=True,
+                    )
+                    .agg(Start=("Start", "min"), End=("End", "max"))
+                )
+
                 fig = px.timeline(
-                    plot_df,
+                    timeline_df,
                     x_start="Start",
                     x_end="End",
                     y="Technician",
@@ -470,12 +608,8 @@ try:
                 )
                 fig.update_yaxes(autorange="reversed")
 
-                day_start_vis = datetime.combine(
-                    selected_date, datetime.min.time()
-                ).replace(hour=6)
-                day_end_vis = datetime.combine(
-                    selected_date, datetime.min.time()
-                ).replace(hour=20)
+                day_start_vis = datetime.combine(selected_date, time(6))
+                day_end_vis = datetime.combine(selected_date, time(20))
 
                 xaxis_config = dict(gridcolor="rgba(255,255,255,0.1)")
                 if enable_clipping:
@@ -496,29 +630,37 @@ try:
 
         with col_stats:
             st.markdown("#### Optimizable Time per Technician")
-            for _, row in agg_day.iterrows():
-                total_opt_m = row["Idle Mins"] + row["Travel Mins"]
-                st.markdown(
-                    f"""
+            # Build all cards in one pass over plain column arrays and emit a
+            # single markdown block - no per-row Series, one DOM update
+            tech_cards = [
+                f"""
                 <div style="margin-bottom: 15px; padding: 10px; background: rgba(255,255,255,0.03); border-radius: 8px;">
-                    <div style="font-weight: bold; color: #00C9FF;">{row["Technician"]}</div>
+                    <div style="font-weight: bold; color: #00C9FF;">{tech}</div>
                     <div style="display: flex; justify-content: space-between; font-size: 0.85rem;">
-                        <span>Inactivity: {row["Idle Mins"]} min</span><span>{row["Idle %"]}%</span>
+                        <span>Inactivity: {idle_m} min</span><span>{idle_pct}%</span>
                     </div>
                     <div style="display: flex; justify-content: space-between; font-size: 0.85rem;">
-                        <span>Travel: {row["Travel Mins"]} min</span><span>{row["Travel %"]}%</span>
+                        <span>Travel: {travel_m} min</span><span>{travel_pct}%</span>
                     </div>
                     <div style="display: flex; justify-content: space-between; font-weight: bold; margin-top: 5px; color: #FF4B4B;">
-                        <span>Total: {total_opt_m} min</span><span>{row["Opt %"]}%</span>
+                        <span>Total: {idle_m + travel_m} min</span><span>{opt_pct}%</span>
                     </div>
                     <div style="background: rgba(255,255,255,0.1); height: 6px; border-radius: 3px; display: flex; overflow: hidden; margin-top: 5px;">
-                        <div style="background: #FF4B4B; width: {row["Idle %"]}%;"></div>
-                        <div style="background: #00C9FF; width: {row["Travel %"]}%;"></div>
+                        <div style="background: #FF4B4B; width: {idle_pct}%;"></div>
+                        <div style="background: #00C9FF; width: {travel_pct}%;"></div>
                     </div>
                 </div>
-                """,
-                    unsafe_allow_html=True,
+                """
+                for tech, idle_m, travel_m, idle_pct, travel_pct, opt_pct in zip(
+                    agg_day["Technician"],
+                    agg_day["Idle Mins"],
+                    agg_day["Travel Mins"],
+                    agg_day["Idle %"],
+                    agg_day["Travel %"],
+                    agg_day["Opt %"],
                 )
+            ]
+            st.markdown("".join(tech_cards), unsafe_allow_html=True)
 
         # Row 2: Map
         st.markdown("### Route Map")
@@ -526,59 +668,56 @@ try:
 
         map_data = daily_df.dropna(subset=["Latitude", "Longitude"]).copy()
         if not map_data.empty:
-            map_data["Technician"] = map_data.apply(
-                lambda r: r["LeadTechnician"] if r["LeadTechnician"] else "Unknown",
-                axis=1,
+            map_data["Technician"] = map_data["LeadTechnician"].mask(
+                map_data["LeadTechnician"].isna()
+                | map_data["LeadTechnician"].eq(""),
+                "Unknown",
             )
 
             # Filter map data as well for the 5-min rule
             valid_techs = agg_day["Technician"].tolist()
             map_data = map_data[map_data["Technician"].isin(valid_techs)]
 
-            map_data["Latitude"] = pd.to_numeric(map_data["Latitude"])
-            map_data["Longitude"] = pd.to_numeric(map_data["Longitude"])
             map_data = map_data.sort_values(by=["Technician", "ArrivalTimeReal"])
 
-            fig_map = px.line_map(
-                map_data,
-                lat="Latitude",
-                lon="Longitude",
-                color="Technician",
-                hover_name="CompanyName",
-                hover_data={
-                    "Latitude": False,
-                    "Longitude": False,
-                    "Technician": True,
-                    "ServiceCode": True,
-                    "ArrivalTimeReal": True,
-                    "DepartureTimeReal": True,
-                },
-                zoom=8,
-                height=600,
-            )
-
-            fig_markers = px.scatter_map(
-                map_data,
-                lat="Latitude",
-                lon="Longitude",
-                color="Technician",
-                hover_name="CompanyName",
-                hover_data={
-                    "Latitude": False,
-                    "Longitude": False,
-                    "Technician": True,
-                    "ServiceCode": True,
-                    "ArrivalTimeReal": True,
-                    "DepartureTimeReal": True,
-                },
-            )
-
-            for trace in fig_markers.data:
-                trace.update(showlegend=False)
-                fig_map.add_trace(trace)
+            # One lines+markers trace per technician built straight from the
+            # column arrays - no second px figure or trace-copy loop
+            fig_map = go.Figure()
+            for tech, sub in map_data.groupby("Technician", sort=False):
+                fig_map.add_trace(
+                    go.Scattermap(
+                        lat=sub["Latitude"].to_numpy(),
+                        lon=sub["Longitude"].to_numpy(),
+                        mode="lines+markers",
+                        name=tech,
+                        customdata=sub[
+                            [
+                                "CompanyName",
+                                "ServiceCode",
+                                "ArrivalTimeReal",
+                                "DepartureTimeReal",
+                            ]
+                        ].to_numpy(),
+                        hovertemplate=(
+                            "<b>%{customdata[0]}</b><br>"
+                            f"Technician={tech}<br>"
+                            "ServiceCode=%{customdata[1]}<br>"
+                            "ArrivalTimeReal=%{customdata[2]}<br>"
+                            "DepartureTimeReal=%{customdata[3]}<extra></extra>"
+                        ),
+                    )
+                )
 
             fig_map.update_layout(
-                map_style="dark",
+                map=dict(
+                    style="dark",
+                    zoom=8,
+                    center=dict(
+                        lat=float(map_data["Latitude"].mean()),
+                        lon=float(map_data["Longitude"].mean()),
+                    ),
+                ),
+                height=600,
                 margin={"r": 0, "t": 0, "l": 0, "b": 0},
                 paper_bgcolor="rgba(0,0,0,0)",
                 plot_bgcolor="rgba(0,0,0,0)",
@@ -45,3 +45,11 @@ class DatabaseUtils:
             )
 
         return f"mssql+pymssql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+
+    @staticmethod
+    def get_connectorx_uri() -> str:
+        """Connection URI for connectorx, which expects a plain mssql://
+        scheme rather than SQLAlchemy's dialect+driver form."""
+        return DatabaseUtils.get_connection_string().replace(
+            "mssql+pymssql://", "mssql://", 1
+        )